@@ -5,9 +5,24 @@ import MCP
 /// Provides advanced Spotlight-based file search with multiple query types and filtering
 public class FileSearchToolHandler {
     
+    /// Shared ISO 8601 parser for date arguments, created once instead of per filter
+    private static let isoDateFormatter = ISO8601DateFormatter()
+    
+    /// Tool definition built once; the schema never changes at runtime
+    private static let toolDefinition = makeToolDefinition()
+    
+    /// Shared error result for calls naming a tool this handler does not serve
+    private static let unknownToolResult = CallTool.Result(content: [.text("Unknown tool")], isError: true)
+    
     /// Returns the tool definition for the file-search tool
     /// - Returns: Tool definition with complete parameter schema
     public static func getToolDefinition() -> Tool {
+        return toolDefinition
+    }
+    
+    /// Builds the tool definition and its input schema
+    /// - Returns: Tool definition with complete parameter schema
+    private static func makeToolDefinition() -> Tool {
         return Tool(
             name: "file-search",
             description: "Advanced Spotlight-backed file search on macOS with support for complex filter combinations using AND/OR logic.",
@@ -117,6 +132,10 @@ public class FileSearchToolHandler {
                     "timeoutSeconds": .object([
                         "type": .string("number"),
                         "description": .string("Timeout in seconds before returning partial results. Default: 10")
+                    ]),
+                    "includeMetadata": .object([
+                        "type": .string("boolean"),
+                        "description": .string("If false, only path and name are returned for each result, which is faster for large result sets. Default: true")
                     ])
                 ]),
                 "required": .array([])
@@ -132,119 +151,13 @@ public class FileSearchToolHandler {
         
         guard params.name == "file-search" else {
             Logger.warning("Unknown tool requested: \(params.name)")
-            return .init(content: [.text("Unknown tool")], isError: true)
+            return unknownToolResult
         }
 
         do {
-            Logger.debug("Parsing tool arguments")
-            
-            // Extract arguments from Value type
-            let query = params.arguments?["query"]?.stringValue ?? ""
-            Logger.debug("Query parameter: '\(query)'")
-            
-            // Parse queryType
-            let queryTypeStr = params.arguments?["queryType"]?.stringValue
-            let queryType = queryTypeStr.flatMap { QueryType(rawValue: $0) }
-            Logger.debug("QueryType parameter: \(queryType?.rawValue ?? "not specified")")
-            
-            // Parse extensions array
-            var extensions: [String]? = nil
-            if let extensionsValue = params.arguments?["extensions"],
-               case .array(let arrayValues) = extensionsValue {
-                extensions = arrayValues.compactMap { $0.stringValue }
-                Logger.debug("Extensions parameter: \(extensions?.joined(separator: ", ") ?? "none")")
-            }
-            
-            // Extract onlyIn array if present
-            var onlyIn: [String]? = nil
-            if let onlyInValue = params.arguments?["onlyIn"],
-               case .array(let arrayValues) = onlyInValue {
-                onlyIn = arrayValues.compactMap { $0.stringValue }
-                Logger.debug("OnlyIn parameter: \(onlyIn?.joined(separator: ", ") ?? "none")")
-            }
-            
-            // Parse dateFilter
-            var dateFilter: DateFilter? = nil
-            if let dateFilterValue = params.arguments?["dateFilter"],
-               case .object(let dateObj) = dateFilterValue {
-                let formatter = ISO8601DateFormatter()
-                let from = dateObj["from"]?.stringValue.flatMap { formatter.date(from: $0) }
-                let to = dateObj["to"]?.stringValue.flatMap { formatter.date(from: $0) }
-                if from != nil || to != nil {
-                    dateFilter = DateFilter(from: from, to: to)
-                    Logger.debug("DateFilter - from: \(from?.description ?? "nil"), to: \(to?.description ?? "nil")")
-                }
-            }
-            
-            // Parse sort options
-            let sortByStr = params.arguments?["sortBy"]?.stringValue
-            let sortBy = sortByStr.flatMap { SortOption(rawValue: $0) }
-            Logger.debug("SortBy parameter: \(sortBy?.rawValue ?? "not specified")")
-            
-            let sortOrderStr = params.arguments?["sortOrder"]?.stringValue
-            let sortOrder = sortOrderStr.flatMap { SortOrder(rawValue: $0) }
-            Logger.debug("SortOrder parameter: \(sortOrder?.rawValue ?? "not specified")")
-            
-            // Extract filenameOnly boolean if present (for backward compatibility)
-            let filenameOnly = params.arguments?["filenameOnly"]?.boolValue
-            Logger.debug("FilenameOnly parameter: \(filenameOnly?.description ?? "not specified")")
-            
-            // Parse advanced query if present
-            var advancedQuery: AdvancedQuery? = nil
-            if let advancedQueryValue = params.arguments?["advancedQuery"],
-               case .object(let advancedObj) = advancedQueryValue {
-                advancedQuery = try parseAdvancedQuery(from: advancedObj)
-                Logger.debug("AdvancedQuery parsed with \(advancedQuery?.filterGroups.count ?? 0) filter groups")
-            }
-            
-            // Extract limit number if present
-            var limit: Int? = nil
-            if let limitValue = params.arguments?["limit"] {
-                switch limitValue {
-                case .int(let num):
-                    limit = num
-                case .double(let num):
-                    limit = Int(num)
-                case .string(let str):
-                    limit = Int(str)
-                default:
-                    break
-                }
-            }
-            Logger.debug("Limit parameter: \(limit?.description ?? "not specified")")
-            
-            // Extract timeoutSeconds number if present
-            var timeoutSeconds: Double? = nil
-            if let timeoutValue = params.arguments?["timeoutSeconds"] {
-                switch timeoutValue {
-                case .double(let d):
-                    timeoutSeconds = d
-                case .int(let i):
-                    timeoutSeconds = Double(i)
-                case .string(let s):
-                    timeoutSeconds = Double(s)
-                default:
-                    break
-                }
-            }
-            Logger.debug("TimeoutSeconds parameter: \(timeoutSeconds?.description ?? "not specified")")
-            
-            // Create SearchArgs with all parameters including advanced query
-            let args = SearchArgs(
-                query: query,
-                queryType: queryType,
-                extensions: extensions,
-                onlyIn: onlyIn,
-                dateFilter: dateFilter,
-                advancedQuery: advancedQuery,
-                sortBy: sortBy,
-                sortOrder: sortOrder,
-                limit: limit,
-                filenameOnly: filenameOnly,
-                timeoutSeconds: timeoutSeconds
-            )
+            let args = try parseSearchArgs(from: params.arguments ?? [:])
 
-            Logger.info("Starting Spotlight search with query: '\(query)'")
+            Logger.info("Starting Spotlight search with query: '\(args.query)'")
             let startTime = CFAbsoluteTimeGetCurrent()
             
             // Run Spotlight query using the new actor-based implementation
@@ -257,9 +170,9 @@ public class FileSearchToolHandler {
             let encoder = JSONEncoder()
             encoder.dateEncodingStrategy = .iso8601
             let payload = try encoder.encode(hits)
-            let json = String(data: payload, encoding: .utf8) ?? "[]"
+            let json = String(decoding: payload, as: UTF8.self)
 
-            Logger.debug("Response JSON size: \(json.count) characters")
+            Logger.debug("Response JSON size: \(payload.count) bytes")
             return .init(content: [.text(json)], isError: false)
         } catch {
             Logger.error("Search failed with error: \(error.localizedDescription)")
@@ -270,6 +183,99 @@ public class FileSearchToolHandler {
         }
     }
     
+    /// Parses tool arguments into search parameters
+    /// - Parameter arguments: Raw MCP arguments from the CallTool request
+    /// - Returns: SearchArgs for the Spotlight search
+    /// - Throws: Error if the advanced query is malformed
+    private static func parseSearchArgs(from arguments: [String: MCP.Value]) throws -> SearchArgs {
+        Logger.debug("Parsing tool arguments")
+        
+        // Extract arguments from Value type
+        let query = arguments["query"]?.stringValue ?? ""
+        Logger.debug("Query parameter: '\(query)'")
+        
+        // Parse queryType
+        let queryTypeStr = arguments["queryType"]?.stringValue
+        let queryType = queryTypeStr.flatMap { QueryType(rawValue: $0) }
+        Logger.debug("QueryType parameter: \(queryType?.rawValue ?? "not specified")")
+        
+        // Parse extensions array
+        var extensions: [String]? = nil
+        if let extensionsValue = arguments["extensions"],
+           case .array(let arrayValues) = extensionsValue {
+            extensions = arrayValues.compactMap { $0.stringValue }
+            Logger.debug("Extensions parameter: \(extensions?.joined(separator: ", ") ?? "none")")
+        }
+        
+        // Extract onlyIn array if present
+        var onlyIn: [String]? = nil
+        if let onlyInValue = arguments["onlyIn"],
+           case .array(let arrayValues) = onlyInValue {
+            onlyIn = arrayValues.compactMap { $0.stringValue }
+            Logger.debug("OnlyIn parameter: \(onlyIn?.joined(separator: ", ") ?? "none")")
+        }
+        
+        // Parse dateFilter
+        var dateFilter: DateFilter? = nil
+        if let dateFilterValue = arguments["dateFilter"],
+           case .object(let dateObj) = dateFilterValue {
+            let parsed = try parseDateFilter(from: dateObj)
+            if parsed.from != nil || parsed.to != nil {
+                dateFilter = parsed
+                Logger.debug("DateFilter - from: \(parsed.from?.description ?? "nil"), to: \(parsed.to?.description ?? "nil")")
+            }
+        }
+        
+        // Parse sort options
+        let sortByStr = arguments["sortBy"]?.stringValue
+        let sortBy = sortByStr.flatMap { SortOption(rawValue: $0) }
+        Logger.debug("SortBy parameter: \(sortBy?.rawValue ?? "not specified")")
+        
+        let sortOrderStr = arguments["sortOrder"]?.stringValue
+        let sortOrder = sortOrderStr.flatMap { SortOrder(rawValue: $0) }
+        Logger.debug("SortOrder parameter: \(sortOrder?.rawValue ?? "not specified")")
+        
+        // Extract filenameOnly boolean if present (for backward compatibility)
+        let filenameOnly = arguments["filenameOnly"]?.boolValue
+        Logger.debug("FilenameOnly parameter: \(filenameOnly?.description ?? "not specified")")
+        
+        // Parse advanced query if present
+        var advancedQuery: AdvancedQuery? = nil
+        if let advancedQueryValue = arguments["advancedQuery"],
+           case .object(let advancedObj) = advancedQueryValue {
+            advancedQuery = try parseAdvancedQuery(from: advancedObj)
+            Logger.debug("AdvancedQuery parsed with \(advancedQuery?.filterGroups.count ?? 0) filter groups")
+        }
+        
+        // Extract limit number if present
+        let limit = integerValue(from: arguments["limit"]).map { Int($0) }
+        Logger.debug("Limit parameter: \(limit?.description ?? "not specified")")
+        
+        // Extract timeoutSeconds number if present
+        let timeoutSeconds = doubleValue(from: arguments["timeoutSeconds"])
+        Logger.debug("TimeoutSeconds parameter: \(timeoutSeconds?.description ?? "not specified")")
+        
+        // Extract includeMetadata boolean if present
+        let includeMetadata = arguments["includeMetadata"]?.boolValue
+        Logger.debug("IncludeMetadata parameter: \(includeMetadata?.description ?? "not specified")")
+        
+        // Create SearchArgs with all parameters including advanced query
+        return SearchArgs(
+            query: query,
+            queryType: queryType,
+            extensions: extensions,
+            onlyIn: onlyIn,
+            dateFilter: dateFilter,
+            advancedQuery: advancedQuery,
+            sortBy: sortBy,
+            sortOrder: sortOrder,
+            limit: limit,
+            filenameOnly: filenameOnly,
+            timeoutSeconds: timeoutSeconds,
+            includeMetadata: includeMetadata
+        )
+    }
+    
     /// Parses advanced query from MCP Value object structure
     /// - Parameter advancedObj: Dictionary containing filterGroups
     /// - Returns: AdvancedQuery object
@@ -373,9 +379,8 @@ public class FileSearchToolHandler {
     /// - Returns: DateFilter object
     /// - Throws: Error if parsing fails
     private static func parseDateFilter(from dateObj: [String: MCP.Value]) throws -> DateFilter {
-        let formatter = ISO8601DateFormatter()
-        let from = dateObj["from"]?.stringValue.flatMap { formatter.date(from: $0) }
-        let to = dateObj["to"]?.stringValue.flatMap { formatter.date(from: $0) }
+        let from = dateObj["from"]?.stringValue.flatMap { isoDateFormatter.date(from: $0) }
+        let to = dateObj["to"]?.stringValue.flatMap { isoDateFormatter.date(from: $0) }
         return DateFilter(from: from, to: to)
     }
     
@@ -384,38 +389,53 @@ public class FileSearchToolHandler {
     /// - Returns: SizeFilter object
     /// - Throws: Error if parsing fails
     private static func parseSizeFilter(from sizeObj: [String: MCP.Value]) throws -> SizeFilter {
-        let minSize: Int64?
-        if let minValue = sizeObj["minSize"] {
-            switch minValue {
-            case .int(let i):
-                minSize = Int64(i)
-            case .double(let d):
-                minSize = Int64(d)
-            case .string(let s):
-                minSize = Int64(s)
-            default:
-                minSize = nil
-            }
-        } else {
-            minSize = nil
+        return SizeFilter(minSize: integerValue(from: sizeObj["minSize"]),
+                          maxSize: integerValue(from: sizeObj["maxSize"]))
+    }
+    
+    /// Reads an integer from a number or numeric string MCP value
+    /// Numbers outside the Int64 range are clamped to its bounds
+    /// - Parameter value: Value to convert, if present
+    /// - Returns: Integer value, or nil if absent, not numeric, or NaN
+    private static func integerValue(from value: MCP.Value?) -> Int64? {
+        switch value {
+        case .int(let i)?:
+            return Int64(i)
+        case .double(let d)?:
+            return clampedInteger(from: d)
+        case .string(let s)?:
+            return Int64(s) ?? Double(s).flatMap { clampedInteger(from: $0) }
+        default:
+            return nil
         }
-        
-        let maxSize: Int64?
-        if let maxValue = sizeObj["maxSize"] {
-            switch maxValue {
-            case .int(let i):
-                maxSize = Int64(i)
-            case .double(let d):
-                maxSize = Int64(d)
-            case .string(let s):
-                maxSize = Int64(s)
-            default:
-                maxSize = nil
-            }
-        } else {
-            maxSize = nil
+    }
+    
+    /// Truncates a double to Int64, clamping out-of-range values instead of trapping
+    /// - Parameter number: Number to convert
+    /// - Returns: Clamped integer, or nil for NaN
+    private static func clampedInteger(from number: Double) -> Int64? {
+        guard !number.isNaN else { return nil }
+        // Double(Int64.max) rounds up to 2^63, so anything at or above it is out of range
+        if number >= Double(Int64.max) { return .max }
+        if number <= Double(Int64.min) { return .min }
+        return Int64(number.rounded(.towardZero))
+    }
+    
+    /// Reads a finite floating-point number from a number or numeric string MCP value
+    /// - Parameter value: Value to convert, if present
+    /// - Returns: Double value, or nil if absent, not numeric, or not finite
+    private static func doubleValue(from value: MCP.Value?) -> Double? {
+        let number: Double?
+        switch value {
+        case .double(let d)?:
+            number = d
+        case .int(let i)?:
+            number = Double(i)
+        case .string(let s)?:
+            number = Double(s)
+        default:
+            number = nil
         }
-        
-        return SizeFilter(minSize: minSize, maxSize: maxSize)
+        return number.flatMap { $0.isFinite ? $0 : nil }
     }
 }
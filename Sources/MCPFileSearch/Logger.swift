@@ -1,7 +1,7 @@
 import Foundation
 
 /// Log levels for filtering log output
-public enum LogLevel: String {
+public enum LogLevel: String, Sendable {
     /// Detailed debugging information
     case debug = "DEBUG"
     /// General informational messages
@@ -12,9 +12,49 @@ public enum LogLevel: String {
     case error = "ERROR"
 }
 
+extension LogLevel: Comparable {
+    /// Relative severity used to filter messages below the minimum level
+    private var severity: Int {
+        switch self {
+        case .debug: return 0
+        case .info: return 1
+        case .warning: return 2
+        case .error: return 3
+        }
+    }
+    
+    public static func < (lhs: LogLevel, rhs: LogLevel) -> Bool {
+        return lhs.severity < rhs.severity
+    }
+}
+
+extension LogLevel {
+    /// Parses a MCP_FILE_SEARCH_LOG_LEVEL value case-insensitively
+    /// Unset or unrecognized values fall back to info
+    /// - Parameter environmentValue: debug, info, warn/warning, or error; nil when unset
+    public init(environmentValue: String?) {
+        guard let value = environmentValue?.uppercased() else {
+            self = .info
+            return
+        }
+        if value == "WARNING" {
+            self = .warning
+            return
+        }
+        self = LogLevel(rawValue: value) ?? .info
+    }
+}
+
 /// Thread-safe logger that writes to both stderr and a log file
 /// Log files are stored in ~/.local/share/mcp-file-search/log/
+/// Messages below the minimum level are skipped before they are formatted
 public class Logger {
+    /// Lowest level that is written, read once from MCP_FILE_SEARCH_LOG_LEVEL
+    /// (debug, info, warn, error); debug messages are dropped by default
+    public static let minimumLevel = LogLevel(
+        environmentValue: ProcessInfo.processInfo.environment["MCP_FILE_SEARCH_LOG_LEVEL"]
+    )
+    
     private static let dateFormatter: DateFormatter = {
         let formatter = DateFormatter()
         formatter.dateFormat = "yyyy-MM-dd HH:mm:ss.SSS"
@@ -37,63 +77,68 @@ public class Logger {
         }
     }()
     
+    /// Log file handle, opened once on first use and only written from logQueue
+    private static let logFileHandle: FileHandle? = {
+        guard let logFileURL = logFileURL else { return nil }
+        if !FileManager.default.fileExists(atPath: logFileURL.path) {
+            FileManager.default.createFile(atPath: logFileURL.path, contents: nil, attributes: nil)
+        }
+        
+        do {
+            let fileHandle = try FileHandle(forWritingTo: logFileURL)
+            _ = try? fileHandle.seekToEnd()
+            return fileHandle
+        } catch {
+            fputs("Warning: Failed to open log file: \(error)\n", stderr)
+            return nil
+        }
+    }()
+    
     private static let logQueue = DispatchQueue(label: "com.mcpfilesearch.logger", qos: .utility)
     
     /// Logs a message at the specified level
     /// - Parameters:
     ///   - level: The log level
-    ///   - message: The message to log
+    ///   - message: The message to log, only evaluated if the level is enabled
     ///   - file: Source file (automatically captured)
     ///   - function: Source function (automatically captured)
     ///   - line: Source line number (automatically captured)
-    public static func log(_ level: LogLevel, _ message: String, file: String = #file, function: String = #function, line: Int = #line) {
+    public static func log(_ level: LogLevel, _ message: @autoclosure () -> String, file: String = #file, function: String = #function, line: Int = #line) {
+        guard level >= minimumLevel else { return }
+        
         let timestamp = dateFormatter.string(from: Date())
-        let fileName = URL(fileURLWithPath: file).lastPathComponent
-        let logMessage = "[\(timestamp)] [\(level.rawValue)] [\(fileName):\(line)] \(function): \(message)\n"
+        let fileName = file.lastIndex(of: "/").map { String(file[file.index(after: $0)...]) } ?? file
+        let logMessage = "[\(timestamp)] [\(level.rawValue)] [\(fileName):\(line)] \(function): \(message())\n"
         
         // Always log to stderr for immediate feedback
         fputs(logMessage, stderr)
         fflush(stderr)
         
-        // Also log to file if available
-        if let logFileURL = logFileURL {
-            logQueue.async {
-                do {
-                    if !FileManager.default.fileExists(atPath: logFileURL.path) {
-                        FileManager.default.createFile(atPath: logFileURL.path, contents: nil, attributes: nil)
-                    }
-                    
-                    let fileHandle = try FileHandle(forWritingTo: logFileURL)
-                    defer { fileHandle.closeFile() }
-                    
-                    fileHandle.seekToEndOfFile()
-                    if let data = logMessage.data(using: .utf8) {
-                        fileHandle.write(data)
-                    }
-                } catch {
-                    // Silently fail to avoid recursive logging
-                }
-            }
+        // Also log to file if available, reusing the handle opened on first write
+        logQueue.async {
+            guard let fileHandle = logFileHandle else { return }
+            // Silently fail to avoid recursive logging; the throwing API keeps I/O errors from crashing
+            try? fileHandle.write(contentsOf: Data(logMessage.utf8))
         }
     }
     
     /// Logs a debug message
-    public static func debug(_ message: String, file: String = #file, function: String = #function, line: Int = #line) {
-        log(.debug, message, file: file, function: function, line: line)
+    public static func debug(_ message: @autoclosure () -> String, file: String = #file, function: String = #function, line: Int = #line) {
+        log(.debug, message(), file: file, function: function, line: line)
     }
     
     /// Logs an info message
-    public static func info(_ message: String, file: String = #file, function: String = #function, line: Int = #line) {
-        log(.info, message, file: file, function: function, line: line)
+    public static func info(_ message: @autoclosure () -> String, file: String = #file, function: String = #function, line: Int = #line) {
+        log(.info, message(), file: file, function: function, line: line)
     }
     
     /// Logs a warning message
-    public static func warning(_ message: String, file: String = #file, function: String = #function, line: Int = #line) {
-        log(.warning, message, file: file, function: function, line: line)
+    public static func warning(_ message: @autoclosure () -> String, file: String = #file, function: String = #function, line: Int = #line) {
+        log(.warning, message(), file: file, function: function, line: line)
     }
     
     /// Logs an error message
-    public static func error(_ message: String, file: String = #file, function: String = #function, line: Int = #line) {
-        log(.error, message, file: file, function: function, line: line)
+    public static func error(_ message: @autoclosure () -> String, file: String = #file, function: String = #function, line: Int = #line) {
+        log(.error, message(), file: file, function: function, line: line)
     }
 }
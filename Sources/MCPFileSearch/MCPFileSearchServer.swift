@@ -27,13 +27,13 @@ public class MCPFileSearchServer {
     public static func configureServer(_ server: Server) async {
         Logger.debug("Configuring server with tool handlers")
         
-        // Advertise tools
+        // Advertise tools; the list is fixed, so build it once rather than per request
         Logger.debug("Registering ListTools handler")
+        let tools = [
+            FileSearchToolHandler.getToolDefinition()
+        ]
         await server.withMethodHandler(ListTools.self) { request in
             Logger.debug("ListTools request received")
-            let tools = [
-                FileSearchToolHandler.getToolDefinition()
-            ]
             Logger.debug("Returning \(tools.count) tool(s) in ListTools response")
             return .init(tools: tools)
         }
@@ -68,33 +68,17 @@ public struct QueryBuilder {
         switch filter {
         case .content(let query):
             guard !query.isEmpty else { return nil }
-            let pattern = "*\(query)*"
             Logger.debug("Building content filter for: '\(query)'")
-            return NSPredicate(format: "%K LIKE[c] %@",
-                             kMDItemTextContent as NSString,
-                             pattern as NSString)
+            return buildLikePredicate(attribute: kMDItemTextContent, pattern: "*\(query)*")
             
         case .filename(let query):
             guard !query.isEmpty else { return nil }
-            let pattern = "*\(query)*"
             Logger.debug("Building filename filter for: '\(query)'")
-            return NSPredicate(format: "%K LIKE[c] %@",
-                             kMDItemFSName as NSString,
-                             pattern as NSString)
+            return buildLikePredicate(attribute: kMDItemFSName, pattern: "*\(query)*")
             
         case .extensions(let extensions):
-            guard !extensions.isEmpty else { return nil }
-            let extensionPredicates = extensions.map { ext in
-                NSPredicate(format: "%K LIKE[c] %@",
-                          kMDItemFSName as NSString,
-                          "*.\(ext)" as NSString)
-            }
             Logger.debug("Building extensions filter for: \(extensions.joined(separator: ", "))")
-            if extensionPredicates.count == 1 {
-                return extensionPredicates[0]
-            } else {
-                return NSCompoundPredicate(orPredicateWithSubpredicates: extensionPredicates)
-            }
+            return buildExtensionsPredicate(extensions: extensions)
             
         case .dateModified(let dateFilter):
             return buildDatePredicate(dateFilter: dateFilter, attribute: kMDItemFSContentChangeDate)
@@ -114,6 +98,54 @@ public struct QueryBuilder {
         }
     }
     
+    /// Builds a comparison predicate directly, without parsing a format string
+    /// - Parameters:
+    ///   - attribute: Metadata attribute key on the left-hand side
+    ///   - type: Comparison operator
+    ///   - value: Constant on the right-hand side
+    ///   - options: Comparison options such as case insensitivity
+    /// - Returns: NSPredicate equivalent to `%K <op> %@`
+    private static func buildComparisonPredicate(attribute: CFString,
+                                                 type: NSComparisonPredicate.Operator,
+                                                 value: Any,
+                                                 options: NSComparisonPredicate.Options = []) -> NSPredicate {
+        return NSComparisonPredicate(leftExpression: NSExpression(forKeyPath: attribute as String),
+                                     rightExpression: NSExpression(forConstantValue: value),
+                                     modifier: .direct,
+                                     type: type,
+                                     options: options)
+    }
+    
+    /// Builds a case-insensitive LIKE predicate on a metadata attribute
+    /// - Parameters:
+    ///   - attribute: Metadata attribute key to match
+    ///   - pattern: Wildcard pattern (`*` and `?` supported)
+    /// - Returns: NSPredicate matching the attribute against the pattern
+    private static func buildLikePredicate(attribute: CFString, pattern: String) -> NSPredicate {
+        return buildComparisonPredicate(attribute: attribute,
+                                        type: .like,
+                                        value: pattern,
+                                        options: .caseInsensitive)
+    }
+    
+    /// Builds filename-extension predicate
+    /// - Parameter extensions: File extensions, with or without a leading dot
+    /// - Returns: NSPredicate matching any of the extensions, or nil if none given
+    private static func buildExtensionsPredicate(extensions: [String]) -> NSPredicate? {
+        // Normalize in one pass: ".swift" and "swift" both match "*.swift"
+        let extensionPredicates = extensions.compactMap { ext -> NSPredicate? in
+            let normalized = ext.drop(while: { $0 == "." })
+            guard !normalized.isEmpty else { return nil }
+            return buildLikePredicate(attribute: kMDItemFSName, pattern: "*.\(normalized)")
+        }
+        guard !extensionPredicates.isEmpty else { return nil }
+        if extensionPredicates.count == 1 {
+            return extensionPredicates[0]
+        } else {
+            return NSCompoundPredicate(orPredicateWithSubpredicates: extensionPredicates)
+        }
+    }
+    
     /// Builds date-based predicate
     /// - Parameters:
     ///   - dateFilter: Date filter with from/to range
@@ -123,16 +155,16 @@ public struct QueryBuilder {
         var predicates: [NSPredicate] = []
         
         if let from = dateFilter.from {
-            predicates.append(NSPredicate(format: "%K >= %@",
-                                        attribute as NSString,
-                                        from as NSDate))
+            predicates.append(buildComparisonPredicate(attribute: attribute,
+                                                       type: .greaterThanOrEqualTo,
+                                                       value: from as NSDate))
             Logger.debug("Added date filter: from \(from)")
         }
         
         if let to = dateFilter.to {
-            predicates.append(NSPredicate(format: "%K <= %@",
-                                        attribute as NSString,
-                                        to as NSDate))
+            predicates.append(buildComparisonPredicate(attribute: attribute,
+                                                       type: .lessThanOrEqualTo,
+                                                       value: to as NSDate))
             Logger.debug("Added date filter: to \(to)")
         }
         
@@ -152,16 +184,16 @@ public struct QueryBuilder {
         var predicates: [NSPredicate] = []
         
         if let minSize = sizeFilter.minSize {
-            predicates.append(NSPredicate(format: "%K >= %@",
-                                        kMDItemFSSize as NSString,
-                                        NSNumber(value: minSize)))
+            predicates.append(buildComparisonPredicate(attribute: kMDItemFSSize,
+                                                       type: .greaterThanOrEqualTo,
+                                                       value: NSNumber(value: minSize)))
             Logger.debug("Added size filter: min \(minSize) bytes")
         }
         
         if let maxSize = sizeFilter.maxSize {
-            predicates.append(NSPredicate(format: "%K <= %@",
-                                        kMDItemFSSize as NSString,
-                                        NSNumber(value: maxSize)))
+            predicates.append(buildComparisonPredicate(attribute: kMDItemFSSize,
+                                                       type: .lessThanOrEqualTo,
+                                                       value: NSNumber(value: maxSize)))
             Logger.debug("Added size filter: max \(maxSize) bytes")
         }
         
@@ -192,103 +224,67 @@ public struct QueryBuilder {
             }.flatMap { $0 }
             
             if !pathFilters.isEmpty {
-                Logger.debug("Using path scopes from advanced query: \(pathFilters.joined(separator: ", "))")
-                return pathFilters
+                let scopes = removingDuplicateScopes(pathFilters)
+                Logger.debug("Using path scopes from advanced query: \(scopes.joined(separator: ", "))")
+                return scopes
             }
         }
         
         // Fall back to legacy onlyIn parameter
         if let onlyIn = args.onlyIn, !onlyIn.isEmpty {
-            Logger.debug("Using legacy onlyIn scopes: \(onlyIn.joined(separator: ", "))")
-            return onlyIn
+            let scopes = removingDuplicateScopes(onlyIn)
+            Logger.debug("Using legacy onlyIn scopes: \(scopes.joined(separator: ", "))")
+            return scopes
         }
         
         // Default to local computer scope
         return [NSMetadataQueryLocalComputerScope]
     }
     
+    /// Removes repeated scopes so Spotlight does not search the same directory twice
+    /// - Parameter scopes: Scopes in caller order, possibly repeated across filter groups
+    /// - Returns: Scopes in first-seen order without duplicates
+    private static func removingDuplicateScopes(_ scopes: [String]) -> [String] {
+        var seen = Set<String>()
+        return scopes.filter { seen.insert($0).inserted }
+    }
+    
     /// Legacy predicate builder for backward compatibility
     /// - Parameter args: Search configuration using legacy parameters
     /// - Returns: NSPredicate built from legacy query structure
     private static func buildLegacyPredicate(from args: SearchArgs) -> NSPredicate {
-        var predicates: [NSPredicate] = []
-        
-        let queryType = args.queryType ?? .all
-        let pattern = "*\(args.query)*"
-        
-        switch queryType {
+        return buildAdvancedPredicate(from: legacyAdvancedQuery(from: args))
+    }
+    
+    /// Translates legacy parameters into the equivalent advanced query, so both
+    /// styles share one predicate implementation; internal for `@testable` tests
+    /// - Parameter args: Search configuration using legacy parameters
+    /// - Returns: AdvancedQuery matching the same files as the legacy parameters
+    internal static func legacyAdvancedQuery(from args: SearchArgs) -> AdvancedQuery {
+        var queryFilters: [[SearchFilter]]
+        switch args.queryType ?? .all {
         case .extension:
             if let extensions = args.extensions, !extensions.isEmpty {
-                let extensionPredicates = extensions.map { ext in
-                    NSPredicate(format: "%K LIKE[c] %@", 
-                              kMDItemFSName as NSString, 
-                              "*.\(ext)" as NSString)
-                }
-                if extensionPredicates.count == 1 {
-                    predicates.append(extensionPredicates[0])
-                } else {
-                    predicates.append(NSCompoundPredicate(orPredicateWithSubpredicates: extensionPredicates))
-                }
-                Logger.debug("Using extension predicates for: \(extensions.joined(separator: ", "))")
-            } else if !args.query.isEmpty {
-                predicates.append(NSPredicate(format: "%K LIKE[c] %@",
-                                            kMDItemFSName as NSString,
-                                            "*.\(args.query)" as NSString))
-                Logger.debug("Using single extension predicate for: \(args.query)")
+                queryFilters = [[.extensions(extensions)]]
+            } else {
+                queryFilters = [[.extensions([args.query])]]
             }
-            
         case .contents:
-            if !args.query.isEmpty {
-                predicates.append(NSPredicate(format: "%K LIKE[c] %@",
-                                            kMDItemTextContent as NSString,
-                                            pattern as NSString))
-                Logger.debug("Using content-only predicate")
-            }
-            
+            queryFilters = [[.content(query: args.query)]]
         case .filename:
-            if !args.query.isEmpty {
-                predicates.append(NSPredicate(format: "%K LIKE[c] %@",
-                                            kMDItemFSName as NSString,
-                                            pattern as NSString))
-                Logger.debug("Using filename-only predicate")
-            }
-            
+            queryFilters = [[.filename(query: args.query)]]
         case .all:
-            if !args.query.isEmpty {
-                let allPredicate = NSPredicate(
-                    format: "%K LIKE[c] %@ OR %K LIKE[c] %@",
-                    kMDItemFSName as NSString, pattern as NSString,
-                    kMDItemTextContent as NSString, pattern as NSString
-                )
-                predicates.append(allPredicate)
-                Logger.debug("Using filename + content predicate")
-            }
+            // "filename OR contents" becomes one group per attribute, since groups are ORed
+            queryFilters = args.query.isEmpty
+                ? [[]]
+                : [[.filename(query: args.query)], [.content(query: args.query)]]
         }
         
         if let dateFilter = args.dateFilter {
-            if let from = dateFilter.from {
-                predicates.append(NSPredicate(format: "%K >= %@",
-                                            kMDItemFSContentChangeDate as NSString,
-                                            from as NSDate))
-                Logger.debug("Added date filter: from \(from)")
-            }
-            if let to = dateFilter.to {
-                predicates.append(NSPredicate(format: "%K <= %@",
-                                            kMDItemFSContentChangeDate as NSString,
-                                            to as NSDate))
-                Logger.debug("Added date filter: to \(to)")
-            }
+            queryFilters = queryFilters.map { $0 + [.dateModified(dateFilter)] }
         }
         
-        if predicates.isEmpty {
-            Logger.debug("No predicates specified, returning match-all predicate")
-            return NSPredicate(value: true)
-        } else if predicates.count == 1 {
-            return predicates[0]
-        } else {
-            let compound = NSCompoundPredicate(andPredicateWithSubpredicates: predicates)
-            Logger.debug("Created compound predicate with \(predicates.count) conditions")
-            return compound
-        }
+        Logger.debug("Translated legacy parameters into \(queryFilters.count) filter group(s)")
+        return AdvancedQuery(filterGroups: queryFilters.map { FilterGroup(filters: $0, combination: .and) })
     }
-}
\ No newline at end of file
+}
@@ -11,36 +11,151 @@ enum SpotlightSearchError: Error {
     case timeout
 }
 
+/// Spotlight attribute keys read from each result, bridged to String once
+private enum ResultAttribute {
+    static let path = kMDItemPath as String
+    static let name = kMDItemFSName as String
+    static let kind = kMDItemKind as String
+    static let size = kMDItemFSSize as String
+    static let created = kMDItemFSCreationDate as String
+    static let modified = kMDItemFSContentChangeDate as String
+    
+    /// Attributes fetched per result; the filename is derived from the path
+    static let fetched = [path, kind, size, created, modified]
+    
+    /// Attributes fetched when the caller only needs paths and filenames
+    static let pathOnly = [path]
+}
+
 /// Actor-based wrapper for Spotlight search operations
 /// Ensures thread-safe access to NSMetadataQuery and prevents concurrent searches
+/// Concurrent requests with identical arguments share the in-flight query,
+/// and repeats within a short window are answered from a result cache
 actor SpotlightSearchActor {
+    /// Results of one Spotlight query; `complete` is false when the timeout cut gathering short
+    typealias SearchOutcome = (hits: [SearchHit], complete: Bool)
+    
+    /// Runs one Spotlight query for the given arguments and clamped limit
+    typealias QueryExecutor = @Sendable (SearchArgs, Int) async throws -> SearchOutcome
+    
     /// Shared singleton instance
     static let shared = SpotlightSearchActor()
     
-    /// Tracks whether a search is currently in progress
-    private var isSearching = false
+    /// How long completed results are reused for identical requests
+    private let cacheTTL: TimeInterval
+    
+    /// Maximum number of result sets kept in the cache
+    private let cacheCapacity: Int
+    
+    /// Runs the underlying query; NSMetadataQuery except in tests
+    private let executeQuery: QueryExecutor
+    
+    /// The search currently in progress, if any, with the arguments it was started for
+    private var inFlight: (args: SearchArgs, task: Task<SearchOutcome, Error>)?
+    
+    /// Number of calls that have joined an in-flight search; internal for `@testable` tests
+    private(set) var joinedSearchCount = 0
+    
+    /// Recently completed results keyed by the arguments that produced them
+    private var resultCache: [SearchArgs: (storedAt: Date, hits: [SearchHit])] = [:]
+    
+    private init() {
+        self.init(cacheTTL: 2.0, cacheCapacity: 32) { args, limit in
+            try await MainActorSpotlightQuery.execute(args: args, limit: limit)
+        }
+    }
+    
+    /// Creates an actor with custom cache settings and query executor
+    /// Internal so `@testable` tests can exercise caching without Spotlight
+    /// - Parameters:
+    ///   - cacheTTL: How long completed results are reused
+    ///   - cacheCapacity: Maximum number of cached result sets
+    ///   - executeQuery: Runs one query and reports whether gathering finished
+    internal init(cacheTTL: TimeInterval, cacheCapacity: Int, executeQuery: @escaping QueryExecutor) {
+        self.cacheTTL = cacheTTL
+        self.cacheCapacity = cacheCapacity
+        self.executeQuery = executeQuery
+    }
     
     /// Performs a Spotlight search with the given parameters
     /// - Parameter args: Search configuration and parameters
     /// - Returns: Array of search results
     /// - Throws: SpotlightSearchError if search cannot be started or times out
     func search(_ args: SearchArgs) async throws -> [SearchHit] {
-        guard !isSearching else {
-            Logger.warning("Search request rejected - another search is already in progress")
-            throw SpotlightSearchError.searchInProgress
+        // Clamp once here so extraction can rely on a non-negative limit
+        let limit = max(0, args.limit ?? 200)
+        guard limit > 0 else {
+            Logger.debug("Limit is zero, skipping Spotlight query")
+            return []
         }
         
-        Logger.debug("Starting Spotlight search for query: '\(args.query)'")
-        isSearching = true
-        defer { 
-            isSearching = false
-            Logger.debug("Search completed, actor ready for next request")
+        if let cached = cachedHits(for: args) {
+            Logger.debug("Returning \(cached.count) cached results")
+            return cached
         }
         
-        let limit = args.limit ?? 200
+        if let current = inFlight {
+            guard current.args == args else {
+                Logger.warning("Search request rejected - another search is already in progress")
+                throw SpotlightSearchError.searchInProgress
+            }
+            Logger.debug("Joining in-flight search with identical arguments")
+            joinedSearchCount += 1
+            return try await current.task.value.hits
+        }
+        
+        Logger.debug("Starting Spotlight search for query: '\(args.query)'")
         Logger.debug("Search limit set to: \(limit)")
         
-        return try await MainActorSpotlightQuery.execute(args: args, limit: limit)
+        let task = Task { [executeQuery] in
+            try await executeQuery(args, limit)
+        }
+        inFlight = (args: args, task: task)
+        defer {
+            inFlight = nil
+            Logger.debug("Search completed, actor ready for next request")
+        }
+        
+        let outcome = try await task.value
+        // Partial results from a timed-out query must not be replayed as complete
+        if outcome.complete {
+            storeInCache(outcome.hits, for: args)
+        } else {
+            Logger.debug("Not caching partial results from a timed-out query")
+        }
+        return outcome.hits
+    }
+    
+    /// Looks up unexpired cached results
+    /// - Parameter args: Search configuration used as the cache key
+    /// - Returns: Cached results, or nil on a miss or expired entry
+    private func cachedHits(for args: SearchArgs) -> [SearchHit]? {
+        guard let entry = resultCache[args] else { return nil }
+        guard Date().timeIntervalSince(entry.storedAt) < cacheTTL else {
+            resultCache[args] = nil
+            return nil
+        }
+        return entry.hits
+    }
+    
+    /// Number of result sets currently held, expired or not; internal for `@testable` tests
+    var cachedResultCount: Int {
+        return resultCache.count
+    }
+    
+    /// Caches results, evicting expired entries and then the oldest when full
+    /// - Parameters:
+    ///   - hits: Results to cache
+    ///   - args: Search configuration used as the cache key
+    private func storeInCache(_ hits: [SearchHit], for args: SearchArgs) {
+        let now = Date()
+        // Drop expired entries on every store so stale result sets are not held indefinitely
+        resultCache = resultCache.filter { now.timeIntervalSince($0.value.storedAt) < cacheTTL }
+        if resultCache.count >= cacheCapacity,
+           let oldest = resultCache.min(by: { $0.value.storedAt < $1.value.storedAt })?.key {
+            resultCache[oldest] = nil
+        }
+        resultCache[args] = (storedAt: now, hits: hits)
     }
 }
 
@@ -53,9 +168,11 @@ private class MainActorSpotlightQuery {
     /// - Parameters:
     ///   - args: Search configuration
     ///   - limit: Maximum number of results to return
-    /// - Returns: Array of search results
+    /// - Returns: Search results and whether gathering finished before the timeout
     /// - Throws: SpotlightSearchError on failure
-    static func execute(args: SearchArgs, limit: Int) async throws -> [SearchHit] {
+    static func execute(args: SearchArgs, limit: Int) async throws -> SpotlightSearchActor.SearchOutcome {
+        let includeMetadata = args.includeMetadata ?? true
+        
         return try await withCheckedThrowingContinuation { continuation in
             let query = NSMetadataQuery()
             
@@ -71,11 +188,11 @@ private class MainActorSpotlightQuery {
                 var hasResumed = false
                 var observer: NSObjectProtocol?
                 var timeoutTask: Task<Void, Never>?
-                let continuation: CheckedContinuation<[SearchHit], Error>
+                let continuation: CheckedContinuation<SpotlightSearchActor.SearchOutcome, Error>
                 let query: NSMetadataQuery
                 let limit: Int
                 
-                init(continuation: CheckedContinuation<[SearchHit], Error>, query: NSMetadataQuery, limit: Int) {
+                init(continuation: CheckedContinuation<SpotlightSearchActor.SearchOutcome, Error>, query: NSMetadataQuery, limit: Int) {
                     self.continuation = continuation
                     self.query = query
                     self.limit = limit
@@ -91,12 +208,12 @@ private class MainActorSpotlightQuery {
                     query.stop()
                 }
                 
-                func resumeWith(results: [SearchHit]) {
+                func resumeWith(results: [SearchHit], complete: Bool) {
                     guard !hasResumed else { return }
                     hasResumed = true
                     cleanup()
-                    Logger.debug("Resuming continuation with \(results.count) results")
-                    continuation.resume(returning: results)
+                    Logger.debug("Resuming continuation with \(results.count) results (complete: \(complete))")
+                    continuation.resume(returning: (hits: results, complete: complete))
                 }
                 
                 func resumeWithError(_ error: Error) {
@@ -117,8 +234,8 @@ private class MainActorSpotlightQuery {
                 queue: .main
             ) { _ in
                 Logger.debug("Query finished gathering, total results: \(query.resultCount)")
-                let results = Self.extractResults(from: query, limit: limit)
-                handler.resumeWith(results: results)
+                let results = Self.extractResults(from: query, limit: limit, includeMetadata: includeMetadata)
+                handler.resumeWith(results: results, complete: true)
             }
             
             // Start the query
@@ -132,9 +249,10 @@ private class MainActorSpotlightQuery {
             Logger.debug("Query started successfully")
             
             // Set up timeout (default 10 seconds, overridable via args.timeoutSeconds)
-            let timeoutSeconds = args.timeoutSeconds ?? 10.0
+            // Clamped to a day so the nanosecond conversion below cannot overflow
+            let timeoutSeconds = min(max(0, args.timeoutSeconds ?? 10.0), 86_400)
             handler.timeoutTask = Task { @MainActor in
-                let nanos = UInt64(max(0, timeoutSeconds) * 1_000_000_000)
+                let nanos = UInt64(timeoutSeconds * 1_000_000_000)
                 do {
                     try await Task.sleep(nanoseconds: nanos)
                 } catch {
@@ -146,8 +264,8 @@ private class MainActorSpotlightQuery {
                 Logger.warning("Query timed out after \(timeoutSeconds) seconds, returning partial results")
                 Logger.warning("Partial result count: \(query.resultCount)")
 
-                let results = Self.extractResults(from: query, limit: limit)
-                handler.resumeWith(results: results)
+                let results = Self.extractResults(from: query, limit: limit, includeMetadata: includeMetadata)
+                handler.resumeWith(results: results, complete: false)
             }
         }
     }
@@ -164,13 +282,13 @@ private class MainActorSpotlightQuery {
         let key: String
         switch sortBy {
         case .name:
-            key = kMDItemFSName as String
+            key = ResultAttribute.name
         case .dateModified:
-            key = kMDItemFSContentChangeDate as String
+            key = ResultAttribute.modified
         case .dateCreated:
-            key = kMDItemFSCreationDate as String
+            key = ResultAttribute.created
         case .size:
-            key = kMDItemFSSize as String
+            key = ResultAttribute.size
         }
         
         Logger.debug("Sort by: \(key), ascending: \(ascending)")
@@ -181,37 +299,46 @@ private class MainActorSpotlightQuery {
     /// - Parameters:
     ///   - query: The completed NSMetadataQuery
     ///   - limit: Maximum number of results to extract
+    ///   - includeMetadata: Whether to fetch kind, size, and dates in addition to the path
     /// - Returns: Array of SearchHit objects with file metadata
-    private static nonisolated func extractResults(from query: NSMetadataQuery, limit: Int) -> [SearchHit] {
+    private static nonisolated func extractResults(from query: NSMetadataQuery, limit: Int, includeMetadata: Bool) -> [SearchHit] {
         let resultCount = query.resultCount
         let actualLimit = min(resultCount, limit)
         Logger.debug("Extracting \(actualLimit) results from \(resultCount) total")
         
-        return (0..<actualLimit).compactMap { idx in
+        var hits: [SearchHit] = []
+        hits.reserveCapacity(actualLimit)
+        let attributes = includeMetadata ? ResultAttribute.fetched : ResultAttribute.pathOnly
+        
+        for idx in 0..<actualLimit {
             guard let item = query.result(at: idx) as? NSMetadataItem else {
                 Logger.warning("Failed to cast result at index \(idx) to NSMetadataItem")
-                return nil
+                continue
             }
             
-            let path = item.value(forAttribute: kMDItemPath as String) as? String ?? ""
-            let name = item.value(forAttribute: kMDItemFSName as String) as? String ?? ""
-            let kind = item.value(forAttribute: kMDItemKind as String) as? String
-            let size = item.value(forAttribute: kMDItemFSSize as String) as? Int64
-            let created = item.value(forAttribute: kMDItemFSCreationDate as String) as? Date
-            let modified = item.value(forAttribute: kMDItemFSContentChangeDate as String) as? Date
+            // Fetch all attributes in a single call rather than one lookup per field
+            let values = item.values(forAttributes: attributes) ?? [:]
+            let path = values[ResultAttribute.path] as? String ?? ""
+            let name = (path as NSString).lastPathComponent
+            let kind = values[ResultAttribute.kind] as? String
+            let size = (values[ResultAttribute.size] as? NSNumber)?.int64Value
+            let created = values[ResultAttribute.created] as? Date
+            let modified = values[ResultAttribute.modified] as? Date
             
             if path.isEmpty {
                 Logger.warning("Empty path for result at index \(idx)")
             }
             
-            return SearchHit(
+            hits.append(SearchHit(
                 path: path,
                 name: name,
                 kind: kind,
                 size: size,
                 created: created,
                 modified: modified
-            )
+            ))
         }
+        
+        return hits
     }
 }
@@ -33,7 +33,7 @@ public enum SortOrder: String, Codable, Sendable {
 }
 
 /// Filter for date-based searches on modification dates
-public struct DateFilter: Codable, Sendable {
+public struct DateFilter: Codable, Hashable, Sendable {
     /// Start date for filtering (inclusive)
     let from: Date?
     /// End date for filtering (inclusive)
@@ -41,7 +41,7 @@ public struct DateFilter: Codable, Sendable {
 }
 
 /// Filter for size-based searches on file sizes
-public struct SizeFilter: Codable, Sendable {
+public struct SizeFilter: Codable, Hashable, Sendable {
     /// Minimum file size in bytes (inclusive)
     let minSize: Int64?
     /// Maximum file size in bytes (inclusive)
@@ -49,7 +49,7 @@ public struct SizeFilter: Codable, Sendable {
 }
 
 /// Individual filter criteria that can be combined
-public enum SearchFilter: Codable, Sendable {
+public enum SearchFilter: Codable, Hashable, Sendable {
     /// Search within file contents
     case content(query: String)
     /// Search by filename
@@ -75,7 +75,7 @@ public enum FilterCombination: String, Codable, Sendable {
 }
 
 /// Group of filters with combination logic
-public struct FilterGroup: Codable, Sendable {
+public struct FilterGroup: Codable, Hashable, Sendable {
     /// List of filters to apply
     let filters: [SearchFilter]
     /// How to combine the filters (default: and)
@@ -88,7 +88,7 @@ public struct FilterGroup: Codable, Sendable {
 }
 
 /// Advanced query structure supporting filter combinations
-public struct AdvancedQuery: Codable, Sendable {
+public struct AdvancedQuery: Codable, Hashable, Sendable {
     /// Groups of filters (OR logic between groups, AND/OR logic within groups)
     let filterGroups: [FilterGroup]
     
@@ -103,7 +103,7 @@ public struct AdvancedQuery: Codable, Sendable {
 }
 
 /// Arguments for configuring a file search operation
-public struct SearchArgs: Codable, Sendable {
+public struct SearchArgs: Codable, Hashable, Sendable {
     /// The search query text (legacy - use advancedQuery for complex searches)
     let query: String
     /// Type of search to perform (defaults to .all if not specified, legacy)
@@ -126,6 +126,8 @@ public struct SearchArgs: Codable, Sendable {
     let filenameOnly: Bool?
     /// Timeout in seconds for the Spotlight query (default: 10 seconds if not provided)
     let timeoutSeconds: Double?
+    /// Whether to return kind, size, and dates for each hit (default: true)
+    let includeMetadata: Bool?
     
     public init(query: String,
                 queryType: QueryType? = nil,
@@ -137,7 +139,8 @@ public struct SearchArgs: Codable, Sendable {
                 sortOrder: SortOrder? = nil,
                 limit: Int? = nil,
                 filenameOnly: Bool? = nil,
-                timeoutSeconds: Double? = nil) {
+                timeoutSeconds: Double? = nil,
+                includeMetadata: Bool? = nil) {
         self.query = query
         self.extensions = extensions
         self.onlyIn = onlyIn
@@ -148,6 +151,7 @@ public struct SearchArgs: Codable, Sendable {
         self.limit = limit
         self.filenameOnly = filenameOnly
         self.timeoutSeconds = timeoutSeconds
+        self.includeMetadata = includeMetadata
         
         // Handle backward compatibility
         if let filenameOnly = filenameOnly, filenameOnly {
@@ -162,14 +166,16 @@ public struct SearchArgs: Codable, Sendable {
                                sortBy: SortOption? = nil,
                                sortOrder: SortOrder? = nil,
                                limit: Int? = nil,
-                               timeoutSeconds: Double? = nil) -> SearchArgs {
+                               timeoutSeconds: Double? = nil,
+                               includeMetadata: Bool? = nil) -> SearchArgs {
         return SearchArgs(
             query: "", // Empty for advanced queries
             advancedQuery: advancedQuery,
             sortBy: sortBy,
             sortOrder: sortOrder,
             limit: limit,
-            timeoutSeconds: timeoutSeconds
+            timeoutSeconds: timeoutSeconds,
+            includeMetadata: includeMetadata
         )
     }
 }
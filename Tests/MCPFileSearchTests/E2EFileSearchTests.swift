@@ -146,6 +146,66 @@ final class E2EFileSearchTests: XCTestCase {
         }
     }
 
+    func testIncludeMetadataFalseReturnsPathsOnly_e2e() async throws {
+        let cwd = FileManager.default.currentDirectoryPath
+        try await SharedMCP.shared.withClient { client in
+            let args: [String: Value] = [
+                "query": .string("Package.swift"),
+                "filenameOnly": .bool(true),
+                "onlyIn": .array([.string(cwd)]),
+                "includeMetadata": .bool(false),
+                "limit": .int(10),
+                "timeoutSeconds": .double(3)
+            ]
+            let (content, isError) = try await client.callTool(name: "file-search", arguments: args)
+            XCTAssertNotEqual(isError, true)
+            let hits = try Self.decodeHits(from: content)
+            let hit = try XCTUnwrap(hits.first { $0.name == "Package.swift" })
+            XCTAssertTrue(hit.path.hasPrefix(cwd))
+            XCTAssertNil(hit.size)
+            XCTAssertNil(hit.modified)
+        }
+    }
+
+    func testNegativeLimitReturnsNoResults_e2e() async throws {
+        let cwd = FileManager.default.currentDirectoryPath
+        try await SharedMCP.shared.withClient { client in
+            let args: [String: Value] = [
+                "query": .string("Package.swift"),
+                "filenameOnly": .bool(true),
+                "onlyIn": .array([.string(cwd)]),
+                "limit": .int(-5),
+                "timeoutSeconds": .double(3)
+            ]
+            let (content, isError) = try await client.callTool(name: "file-search", arguments: args)
+            XCTAssertNotEqual(isError, true)
+            let hits = try Self.decodeHits(from: content)
+            XCTAssertTrue(hits.isEmpty)
+        }
+    }
+
+    func testRepeatedIdenticalCallReturnsSameHits_e2e() async throws {
+        let cwd = FileManager.default.currentDirectoryPath
+        try await SharedMCP.shared.withClient { client in
+            let args: [String: Value] = [
+                "query": .string("QueryBuilder.swift"),
+                "filenameOnly": .bool(true),
+                "onlyIn": .array([.string(cwd)]),
+                "limit": .int(10),
+                "timeoutSeconds": .double(3)
+            ]
+            let (firstContent, firstIsError) = try await client.callTool(name: "file-search", arguments: args)
+            let (secondContent, secondIsError) = try await client.callTool(name: "file-search", arguments: args)
+
+            XCTAssertNotEqual(firstIsError, true)
+            XCTAssertNotEqual(secondIsError, true)
+            let firstPaths = try Self.decodeHits(from: firstContent).map { $0.path }
+            let secondPaths = try Self.decodeHits(from: secondContent).map { $0.path }
+            XCTAssertFalse(firstPaths.isEmpty)
+            XCTAssertEqual(firstPaths, secondPaths)
+        }
+    }
+
     func testInvalidAdvancedQuery_e2e() async throws {
         try await SharedMCP.shared.withClient { client in
             // Missing required "filters" inside a group
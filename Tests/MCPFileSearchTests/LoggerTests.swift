@@ -0,0 +1,24 @@
+import XCTest
+@testable import MCPFileSearch
+
+final class LoggerTests: XCTestCase {
+    func testUnsetLogLevelDefaultsToInfo() {
+        XCTAssertEqual(LogLevel(environmentValue: nil), .info)
+    }
+
+    func testDebugLogLevel() {
+        XCTAssertEqual(LogLevel(environmentValue: "debug"), .debug)
+    }
+
+    func testWarnLogLevel() {
+        XCTAssertEqual(LogLevel(environmentValue: "warn"), .warning)
+    }
+
+    func testWarningSpellingIsCaseInsensitive() {
+        XCTAssertEqual(LogLevel(environmentValue: "Warning"), .warning)
+    }
+
+    func testUnknownLogLevelFallsBackToInfo() {
+        XCTAssertEqual(LogLevel(environmentValue: "verbose"), .info)
+    }
+}
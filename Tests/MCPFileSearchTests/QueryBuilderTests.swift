@@ -1,6 +1,5 @@
 import XCTest
 @testable import MCPFileSearch
-import CoreServices
 
 final class QueryBuilderTests: XCTestCase {
     
@@ -16,6 +15,26 @@ final class QueryBuilderTests: XCTestCase {
         XCTAssertTrue(description.contains("OR"))
     }
     
+    func testLikePredicateMatchesFormatStringEquivalent() {
+        let args = SearchArgs(query: "report", queryType: .filename)
+        let predicate = QueryBuilder.buildPredicate(for: args)
+        let expected = NSPredicate(format: "%K LIKE[c] %@", "kMDItemFSName", "*report*")
+        
+        XCTAssertEqual(predicate, expected)
+    }
+    
+    func testLegacyAllWithDateFilterAppliesDateToBothAlternatives() {
+        let fromDate = ISO8601DateFormatter().date(from: "2024-01-01T00:00:00Z")!
+        let args = SearchArgs(query: "notes", queryType: .all, dateFilter: DateFilter(from: fromDate, to: nil))
+        let advancedQuery = QueryBuilder.legacyAdvancedQuery(from: args)
+        
+        XCTAssertEqual(advancedQuery.filterGroups.count, 2)
+        for group in advancedQuery.filterGroups {
+            XCTAssertEqual(group.filters.count, 2)
+            XCTAssertEqual(group.filters.last, .dateModified(DateFilter(from: fromDate, to: nil)))
+        }
+    }
+    
     func testLegacyQueryTypeExtension() {
         let args = SearchArgs(query: "swift", queryType: .extension)
         let predicate = QueryBuilder.buildPredicate(for: args)
@@ -36,6 +55,18 @@ final class QueryBuilderTests: XCTestCase {
         XCTAssertTrue(description.contains("*.js"))
     }
     
+    func testExtensionsIgnoreLeadingDot() {
+        let filter = SearchFilter.extensions([".swift", "py", "."])
+        let args = SearchArgs.advanced(AdvancedQuery.single(filters: [filter]))
+        let predicate = QueryBuilder.buildPredicate(for: args)
+        
+        let description = predicate.description
+        XCTAssertTrue(description.contains("\"*.swift\""))
+        XCTAssertTrue(description.contains("\"*.py\""))
+        XCTAssertFalse(description.contains("*.."))
+        XCTAssertFalse(description.contains("\"*.\""))
+    }
+    
     func testSimpleAdvancedQuery() {
         let contentFilter = SearchFilter.content(query: "hello")
         let extensionsFilter = SearchFilter.extensions(["pdf", "docx"])
@@ -140,6 +171,16 @@ final class QueryBuilderTests: XCTestCase {
         XCTAssertTrue(scopes.contains("/Users/test/Desktop"))
     }
     
+    func testSearchScopesDeduplicatedAcrossGroups() {
+        let group1 = FilterGroup(filters: [SearchFilter.paths(["/tmp", "/var"])])
+        let group2 = FilterGroup(filters: [SearchFilter.paths(["/var", "/tmp", "/opt"])])
+        let args = SearchArgs.advanced(AdvancedQuery(filterGroups: [group1, group2]))
+        
+        let scopes = QueryBuilder.extractSearchScopes(from: args)
+        
+        XCTAssertEqual(scopes, ["/tmp", "/var", "/opt"])
+    }
+    
     func testLegacySearchScopes() {
         let args = SearchArgs(query: "test", onlyIn: ["/tmp", "/var"])
         let scopes = QueryBuilder.extractSearchScopes(from: args)
@@ -0,0 +1,189 @@
+import XCTest
+@testable import MCPFileSearch
+
+/// Counts query executions from inside @Sendable executor closures
+private actor ExecutionCounter {
+    private(set) var count = 0
+
+    func increment() {
+        count += 1
+    }
+}
+
+/// Suspends callers until opened, so tests can hold a query in flight without sleeping
+private actor Gate {
+    private var isOpen = false
+    private var waiters: [CheckedContinuation<Void, Never>] = []
+
+    func wait() async {
+        guard !isOpen else { return }
+        await withCheckedContinuation { waiters.append($0) }
+    }
+
+    func open() {
+        isOpen = true
+        waiters.forEach { $0.resume() }
+        waiters.removeAll()
+    }
+}
+
+final class SpotlightSearchActorTests: XCTestCase {
+    private static func hit(for args: SearchArgs) -> SearchHit {
+        SearchHit(path: "/tmp/\(args.query)", name: args.query, kind: nil, size: nil, created: nil, modified: nil)
+    }
+
+    private static func makeActor(cacheTTL: TimeInterval = 60,
+                                  cacheCapacity: Int = 32,
+                                  complete: Bool = true,
+                                  counter: ExecutionCounter) -> SpotlightSearchActor {
+        SpotlightSearchActor(cacheTTL: cacheTTL, cacheCapacity: cacheCapacity) { args, _ in
+            await counter.increment()
+            return (hits: [hit(for: args)], complete: complete)
+        }
+    }
+
+    func testIdenticalSearchWithinTTLUsesCache() async throws {
+        let counter = ExecutionCounter()
+        let actor = Self.makeActor(counter: counter)
+        let args = SearchArgs(query: "report")
+
+        let first = try await actor.search(args)
+        let second = try await actor.search(args)
+
+        XCTAssertEqual(first.map { $0.path }, second.map { $0.path })
+        let count = await counter.count
+        XCTAssertEqual(count, 1)
+    }
+
+    func testExpiredEntryIsQueriedAgain() async throws {
+        let counter = ExecutionCounter()
+        let actor = Self.makeActor(cacheTTL: 0, counter: counter)
+        let args = SearchArgs(query: "report")
+
+        _ = try await actor.search(args)
+        _ = try await actor.search(args)
+
+        let count = await counter.count
+        XCTAssertEqual(count, 2)
+    }
+
+    func testOldestEntryEvictedAtCapacity() async throws {
+        let counter = ExecutionCounter()
+        let actor = Self.makeActor(cacheCapacity: 1, counter: counter)
+
+        _ = try await actor.search(SearchArgs(query: "first"))
+        _ = try await actor.search(SearchArgs(query: "second"))
+        _ = try await actor.search(SearchArgs(query: "first"))
+
+        let count = await counter.count
+        XCTAssertEqual(count, 3)
+    }
+
+    func testTimedOutResultsAreNotCached() async throws {
+        let counter = ExecutionCounter()
+        let actor = Self.makeActor(complete: false, counter: counter)
+        let args = SearchArgs(query: "report", timeoutSeconds: 0.1)
+
+        _ = try await actor.search(args)
+        _ = try await actor.search(args)
+
+        let count = await counter.count
+        XCTAssertEqual(count, 2)
+    }
+
+    /// Builds an actor whose queries signal `started` and then block until `release` opens
+    private static func makeGatedActor(cacheTTL: TimeInterval = 60,
+                                       counter: ExecutionCounter,
+                                       started: Gate,
+                                       release: Gate) -> SpotlightSearchActor {
+        SpotlightSearchActor(cacheTTL: cacheTTL, cacheCapacity: 32) { args, _ in
+            await counter.increment()
+            await started.open()
+            await release.wait()
+            return (hits: [hit(for: args)], complete: true)
+        }
+    }
+
+    func testConcurrentIdenticalSearchesShareOneQuery() async throws {
+        let counter = ExecutionCounter()
+        let started = Gate()
+        let release = Gate()
+        // A zero TTL rules out the second call being answered from the cache
+        let actor = Self.makeGatedActor(cacheTTL: 0, counter: counter, started: started, release: release)
+        let args = SearchArgs(query: "shared")
+
+        async let first = actor.search(args)
+        await started.wait()
+        async let second = actor.search(args)
+        while await actor.joinedSearchCount == 0 {
+            await Task.yield()
+        }
+        await release.open()
+        let firstHits = try await first
+        let secondHits = try await second
+
+        XCTAssertEqual(firstHits.map { $0.path }, ["/tmp/shared"])
+        XCTAssertEqual(firstHits.map { $0.path }, secondHits.map { $0.path })
+        let count = await counter.count
+        XCTAssertEqual(count, 1)
+    }
+
+    func testDifferentSearchRejectedWhileAnotherInFlight() async throws {
+        let counter = ExecutionCounter()
+        let started = Gate()
+        let release = Gate()
+        let actor = Self.makeGatedActor(counter: counter, started: started, release: release)
+
+        async let running = actor.search(SearchArgs(query: "running"))
+        await started.wait()
+        do {
+            _ = try await actor.search(SearchArgs(query: "other"))
+            XCTFail("Expected searchInProgress while another search is running")
+        } catch SpotlightSearchError.searchInProgress {
+            // Expected
+        }
+        await release.open()
+        _ = try await running
+
+        let count = await counter.count
+        XCTAssertEqual(count, 1)
+    }
+
+    func testCachedResultServedWhileOtherSearchInFlight() async throws {
+        let counter = ExecutionCounter()
+        let started = Gate()
+        let release = Gate()
+        let actor = SpotlightSearchActor(cacheTTL: 60, cacheCapacity: 32) { args, _ in
+            await counter.increment()
+            if args.query == "slow" {
+                await started.open()
+                await release.wait()
+            }
+            return (hits: [Self.hit(for: args)], complete: true)
+        }
+        let cachedArgs = SearchArgs(query: "fast")
+        _ = try await actor.search(cachedArgs)
+
+        async let slow = actor.search(SearchArgs(query: "slow"))
+        await started.wait()
+        let cached = try await actor.search(cachedArgs)
+        await release.open()
+        _ = try await slow
+
+        XCTAssertEqual(cached.map { $0.path }, ["/tmp/fast"])
+        let count = await counter.count
+        XCTAssertEqual(count, 2)
+    }
+
+    func testExpiredEntriesDroppedOnNextStore() async throws {
+        let counter = ExecutionCounter()
+        // A zero TTL makes every stored entry expired by the time the next one is stored
+        let actor = Self.makeActor(cacheTTL: 0, counter: counter)
+
+        _ = try await actor.search(SearchArgs(query: "first"))
+        _ = try await actor.search(SearchArgs(query: "second"))
+
+        let cachedCount = await actor.cachedResultCount
+        XCTAssertEqual(cachedCount, 1)
+    }
+}